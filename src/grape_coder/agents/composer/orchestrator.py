@@ -1,3 +1,5 @@
+import xml.etree.ElementTree as ET
+
 from strands import Agent
 from strands.multiagent.base import MultiAgentBase
 
@@ -193,8 +195,6 @@ def validate_distribution(xml_distribution: str) -> str:
     Raises:
         XMLValidationError: If XML structure is invalid or required sections are missing.
     """
-    import xml.etree.ElementTree as ET
-
     try:
         if (
             "<context>" in xml_distribution
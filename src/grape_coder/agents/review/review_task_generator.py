@@ -1,3 +1,4 @@
+import xml.etree.ElementTree as ET
 from typing import Any
 
 from strands import Agent
@@ -33,18 +34,16 @@ def display_tasks_markdown(xml_content: str) -> None:
         "LOW": "green",
     }
 
-    md_content = f"## Review Summary\n{summary}\n\n## Tasks ({len(tasks)})\n"
+    md_parts = [f"## Review Summary\n{summary}\n\n## Tasks ({len(tasks)})\n"]
 
     for i, task in enumerate(tasks, 1):
         files = task.get("files", "N/A")
         description = task.get("description", "")
-        priority = task.get("priority", "MEDIUM")
-        color = priority_colors.get(priority.upper(), "white")
-        md_content += (
-            f"### {i}. [{priority.upper()}]({color}) {files}\n{description}\n\n"
-        )
+        priority = task.get("priority", "MEDIUM").upper()
+        color = priority_colors.get(priority, "white")
+        md_parts.append(f"### {i}. [{priority}]({color}) {files}\n{description}\n\n")
 
-    md = Markdown(md_content)
+    md = Markdown("".join(md_parts))
 
     panel = Panel(
         md,
@@ -149,8 +148,6 @@ def validate_tasks(xml_content: str) -> str:
     Raises:
         XMLValidationError: If XML structure is invalid.
     """
-    import xml.etree.ElementTree as ET
-
     try:
         if "<review>" in xml_content:
             start = xml_content.find("<review>")
@@ -2,6 +2,20 @@ import re
 import xml.etree.ElementTree as ET
 from typing import List, Optional, Union
 
+_XML_SECTION_RE = re.compile(r"<[^>]+>.*?</[^>]+>", re.DOTALL)
+
+# (category, ElementPath to its score) for each review score category
+_SCORE_PATHS = tuple(
+    (category, f"{category}[1]/score")
+    for category in (
+        "code_validity",
+        "integration",
+        "responsiveness",
+        "best_practices",
+        "accessibility",
+    )
+)
+
 
 class XMLValidationError(Exception):
     pass
@@ -24,37 +38,19 @@ def extract_review_tasks_from_xml(full_xml_content: str) -> tuple[str, List[dict
         )
 
         tasks = []
-        tasks_elem = root.find("tasks")
-        if tasks_elem is not None:
-            for task_elem in tasks_elem.findall("task"):
-                files_elem = task_elem.find("files")
-                desc_elem = task_elem.find("description")
-                priority_elem = task_elem.find("priority")
-
-                files = (
-                    files_elem.text.strip()
-                    if files_elem is not None and files_elem.text
-                    else ""
-                )
-                description = (
-                    desc_elem.text.strip()
-                    if desc_elem is not None and desc_elem.text
-                    else ""
-                )
-                priority = (
-                    priority_elem.text.strip()
-                    if priority_elem is not None and priority_elem.text
-                    else "MEDIUM"
-                )
-
-                if description:
-                    tasks.append(
-                        {
-                            "files": files,
-                            "description": description,
-                            "priority": priority,
-                        }
-                    )
+        for task_elem in root.iterfind("tasks[1]/task"):
+            description = (task_elem.findtext("description") or "").strip()
+            if not description:
+                continue
+
+            priority = task_elem.findtext("priority")
+            tasks.append(
+                {
+                    "files": (task_elem.findtext("files") or "").strip(),
+                    "description": description,
+                    "priority": priority.strip() if priority else "MEDIUM",
+                }
+            )
 
         return summary, tasks
 
@@ -72,21 +68,11 @@ def extract_scores_from_xml(full_xml_content: str) -> dict:
 
         root = ET.fromstring(full_xml_content)
 
-        scores = {}
-        for category in [
-            "code_validity",
-            "integration",
-            "responsiveness",
-            "best_practices",
-            "accessibility",
-        ]:
-            category_elem = root.find(category)
-            if category_elem is not None:
-                score_elem = category_elem.find("score")
-                if score_elem is not None and score_elem.text:
-                    scores[category] = int(score_elem.text.strip())
-
-        return scores
+        return {
+            category: int(text.strip())
+            for category, path in _SCORE_PATHS
+            if (text := root.findtext(path))
+        }
 
     except ET.ParseError:
         return {}
@@ -137,6 +123,9 @@ def extract_xml_by_tags(
 
     matches = []
     for tag in tags:
+        # Skip the regex scan entirely when the opening tag is not present
+        if f"<{tag}>" not in content:
+            continue
         pattern = rf"<{tag}>.*?</{tag}>"
         match = re.search(pattern, content, re.DOTALL)
         if match:
@@ -145,11 +134,11 @@ def extract_xml_by_tags(
     if matches:
         return join_with.join(matches)
 
-    xml_pattern = r"<[^>]+>.*?</[^>]+>"
-    xml_match = re.search(xml_pattern, content, re.DOTALL)
-
-    if xml_match:
-        return xml_match.group(0)
+    # Any element needs a closing tag, avoid backtracking over plain text
+    if "</" in content:
+        xml_match = _XML_SECTION_RE.search(content)
+        if xml_match:
+            return xml_match.group(0)
 
     return content
 
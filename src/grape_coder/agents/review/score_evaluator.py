@@ -1,3 +1,4 @@
+import xml.etree.ElementTree as ET
 from typing import Any
 
 from strands import Agent
@@ -189,8 +190,6 @@ def validate_scores(xml_content: str) -> str:
     Raises:
         XMLValidationError: If XML structure is invalid.
     """
-    import xml.etree.ElementTree as ET
-
     try:
         if "<review_scores>" in xml_content:
             start = xml_content.find("<review_scores>")
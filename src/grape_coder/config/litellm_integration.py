@@ -1,12 +1,21 @@
-from strands.models.litellm import LiteLLMModel as StrandsLiteLLMModel
+from typing import TYPE_CHECKING
 
 from .models import ProviderConfig, ProviderType
 
+if TYPE_CHECKING:
+    from strands.models.litellm import LiteLLMModel as StrandsLiteLLMModel
+else:
+    # Importing litellm takes seconds, so defer it until a model is created
+    StrandsLiteLLMModel = None
+
 
 def create_litellm_model(
     provider_config: ProviderConfig, model_name: str
-) -> StrandsLiteLLMModel:
+) -> "StrandsLiteLLMModel":
     """Create a LiteLLM model instance from provider configuration."""
+    global StrandsLiteLLMModel
+    if StrandsLiteLLMModel is None:
+        from strands.models.litellm import LiteLLMModel as StrandsLiteLLMModel
 
     # Create client args with API key and base URL
     client_args = {"api_key": provider_config.api_key}
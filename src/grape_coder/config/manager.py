@@ -4,9 +4,16 @@ from pathlib import Path
 from typing import Any, Optional
 
 import platformdirs
+from pydantic import ValidationError
 
 from .litellm_integration import create_litellm_model
-from .models import GrapeCoderConfig, ProviderConfig, AgentConfig, WorkflowConfig
+from .models import (
+    GrapeCoderConfig,
+    ProviderConfig,
+    AgentConfig,
+    WorkflowConfig,
+    LinterConfig,
+)
 from ..agents.identifiers import get_agent_values
 
 # Global config manager instance
@@ -72,8 +79,20 @@ class ConfigManager:
             if not self._config_file.exists():
                 return GrapeCoderConfig(), dropped_items
 
-            with open(self._config_file, "r", encoding="utf-8") as f:
-                config_data = json.load(f)
+            raw = self._config_file.read_bytes()
+
+            required_agents = set(get_agent_values())
+
+            # Fast path: a fully valid file is parsed and validated in one pass
+            try:
+                config = GrapeCoderConfig.model_validate_json(raw)
+            except ValidationError:
+                pass
+            else:
+                if required_agents.issuperset(config.agents):
+                    return config, dropped_items
+
+            config_data = json.loads(raw)
 
             # Extract valid providers
             valid_providers: dict[str, ProviderConfig] = {}
@@ -91,7 +110,6 @@ class ConfigManager:
 
             # Extract valid agents
             valid_agents: dict[str, AgentConfig] = {}
-            required_agents = set(get_agent_values())
             if "agents" in config_data:
                 for agent_name, agent_data in config_data["agents"].items():
                     # Skip unrecognized agents
@@ -118,8 +136,20 @@ class ConfigManager:
                 except Exception:
                     pass
 
+            valid_linter_commands = LinterConfig()
+            if "linter_commands" in config_data:
+                try:
+                    valid_linter_commands = LinterConfig(
+                        **config_data["linter_commands"]
+                    )
+                except Exception:
+                    pass
+
             return GrapeCoderConfig(
-                providers=valid_providers, agents=valid_agents, workflow=valid_workflow
+                providers=valid_providers,
+                agents=valid_agents,
+                workflow=valid_workflow,
+                linter_commands=valid_linter_commands,
             ), dropped_items
 
         except Exception:
@@ -130,13 +160,12 @@ class ConfigManager:
         """Save configuration to file with secure permissions."""
         try:
             # Validate configuration before saving
-            config.model_validate(config.model_dump())
+            raw = config.model_dump_json(indent=4).encode("utf-8")
+            config.model_validate_json(raw)
 
             # Write to temporary file first, then move to prevent corruption
             temp_file = self._config_file.with_suffix(".tmp")
-
-            with open(temp_file, "w", encoding="utf-8") as f:
-                json.dump(config.model_dump(), f, indent=4, ensure_ascii=False)
+            temp_file.write_bytes(raw)
 
             # Set secure permissions on temp file
             self._set_secure_permissions(temp_file)
@@ -179,8 +208,9 @@ class ConfigManager:
             RuntimeError: If model creation fails
         """
         # Check model cache first
-        if agent_identifier in self._model_cache:
-            return self._model_cache[agent_identifier]
+        model = self._model_cache.get(agent_identifier)
+        if model is not None:
+            return model
 
         # Use config loaded during singleton initialization
         if self.config is None:
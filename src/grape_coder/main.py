@@ -272,9 +272,11 @@ def code(
                             f"{global_system_prompt}\n{planner_prompt}\nUSER TASK: {user_input}"
                         )
 
-                        for node_name, node_result in planner_result.results.items():
-                            if hasattr(node_result, "result"):
-                                complete_plan += f"\n=== {node_name.upper()} OUTPUT ===\n{node_result.result}\n"
+                        complete_plan += "".join(
+                            f"\n=== {node_name.upper()} OUTPUT ===\n{node_result.result}\n"
+                            for node_name, node_result in planner_result.results.items()
+                            if hasattr(node_result, "result")
+                        )
 
                         if complete_plan == "":
                             print(
@@ -15,6 +15,8 @@ class TaskFilteringNode(MultiAgentBase):
     def __init__(self, agent_xml_tag: str):
         super().__init__()
         self.agent_xml_tag = agent_xml_tag  # ex: 'class_agent'
+        # First section for this agent only, matching root.find() semantics
+        self._task_path = f"{agent_xml_tag}[1]/task"
 
     def _extract_context(self, full_xml_content: str) -> str:
         """Extracts the global context from the XML content."""
@@ -42,19 +44,12 @@ class TaskFilteringNode(MultiAgentBase):
 
             root = ET.fromstring(full_xml_content)
 
-            # Find the section for this agent
-            agent_section = root.find(self.agent_xml_tag)
-
-            if agent_section is None:
-                return []
-
-            # Extract tasks
-            tasks = []
-            for task in agent_section.findall("task"):
-                if task.text and task.text.strip():
-                    tasks.append(task.text.strip())
-
-            return tasks
+            # Walk this agent's tasks with a single path lookup
+            return [
+                text
+                for task in root.iterfind(self._task_path)
+                if task.text and (text := task.text.strip())
+            ]
 
         except ET.ParseError:
             # Return empty list if parsing fails
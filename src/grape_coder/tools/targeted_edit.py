@@ -1,4 +1,5 @@
 import os
+import re
 from pathlib import Path
 from typing import Optional, Union
 
@@ -63,8 +64,6 @@ def pattern_replace(path: str, pattern: str, new_str: str) -> str:
         new_str: The replacement text
     """
     try:
-        import re
-
         resolved_path = _resolve_path(path)
 
         if not resolved_path.exists():
@@ -1,12 +1,71 @@
+import functools
+import glob
 import os
-from pathlib import Path
-from typing import List
+import re
+from pathlib import Path, PurePath
+from typing import Iterable, Iterator, List, Union
 
 from strands.tools import tool
 
 # Global variable to store work_path for tools
 _work_path = "."
 
+# Files grep_files never opens: binary formats and anything too large to be source
+_BINARY_EXTS = frozenset(
+    {
+        ".png",
+        ".jpg",
+        ".jpeg",
+        ".gif",
+        ".pdf",
+        ".zip",
+        ".gz",
+        ".tar",
+        ".pyc",
+        ".so",
+        ".dylib",
+        ".exe",
+        ".bin",
+        ".wasm",
+    }
+)
+_MAX_GREP_BYTES = 4 * 1024 * 1024
+
+# Directories never descended into by recursive listing and search
+_IGNORED_DIRS = frozenset(
+    {
+        ".git",
+        "node_modules",
+        "__pycache__",
+        ".venv",
+        "venv",
+        ".tox",
+        ".mypy_cache",
+        ".pytest_cache",
+        "dist",
+        "build",
+        "target",
+        ".next",
+    }
+)
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_regex(pattern: str) -> re.Pattern[str]:
+    """Compile a grep pattern once and reuse it across tool calls"""
+    return re.compile(pattern, re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_glob(pattern: str) -> re.Pattern[str]:
+    """Compile a file pattern matching relative paths the way Path.rglob does"""
+    flags = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+    return re.compile(
+        glob.translate(f"**/{pattern}", recursive=True, include_hidden=True), flags
+    )
+
 
 def set_work_path(path: str) -> None:
     """Set the working path for all tools"""
@@ -14,6 +73,47 @@ def set_work_path(path: str) -> None:
     _work_path = path
 
 
+def _prefix_len(root: Path) -> int:
+    """Length to slice off a descendant path string to make it relative to root"""
+    return len(os.path.join(os.fspath(root), ""))
+
+
+def _walk(root: str) -> Iterator[os.DirEntry[str]]:
+    """Yield every entry below root, without descending into _IGNORED_DIRS"""
+    pending = [root]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name in _IGNORED_DIRS:
+                            continue
+                        pending.append(entry.path)
+                    yield entry
+        except OSError:
+            continue
+
+
+def _rglob_pruned(root: Path, pattern: str) -> Iterator[Path]:
+    """Path.rglob(pattern), leaving out anything inside _IGNORED_DIRS below root"""
+    prefix_len = _prefix_len(root)
+    for match in root.rglob(pattern):
+        parents = os.fspath(match)[prefix_len:].split(os.sep)[:-1]
+        if _IGNORED_DIRS.isdisjoint(parents):
+            yield match
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    """Write data to path with a single open, truncating any existing file"""
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
 @tool
 def list_files(path: str = ".", recursive: bool = False) -> str:
     """List files and directories in a path
@@ -33,12 +133,14 @@ def list_files(path: str = ".", recursive: bool = False) -> str:
             return f"Error: Path '{path}' does not exist"
 
         if recursive:
+            prefix_len = _prefix_len(path_obj)
             files: List[str] = []
-            for item in path_obj.rglob("*"):
-                if item.is_file():
-                    files.append(f"  {item.relative_to(path_obj)}")
+            for entry in _walk(os.fspath(path_obj)):
+                rel = entry.path[prefix_len:]
+                if entry.is_file():
+                    files.append(f"  {rel}")
                 else:
-                    files.append(f"📁 {item.relative_to(path_obj)}/")
+                    files.append(f"📁 {rel}/")
             return f"Files in '{path}' (recursive):\n" + "\n".join(sorted(files))
         else:
             items: List[str] = []
@@ -99,15 +201,17 @@ def edit_file(path: str, content: str) -> str:
         if not os.path.isabs(path):
             path = os.path.join(_work_path, path)
 
-        path_obj = Path(path).resolve()
+        # Must be checked before writing, afterwards the file always exists
+        action = "updated" if os.path.lexists(path) else "created"
 
         # Create parent directories if they don't exist
-        path_obj.parent.mkdir(parents=True, exist_ok=True)
+        parent = os.path.dirname(path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
 
         # Write the content
-        path_obj.write_text(content, encoding="utf-8")
+        _write_bytes(path, content.encode("utf-8"))
 
-        action = "updated" if path_obj.exists() else "created"
         return f"File '{path}' {action} successfully"
     except Exception as e:
         return f"Error: {str(e)}"
@@ -124,8 +228,6 @@ def grep_files(pattern: str, path: str = ".", file_pattern: str = "*") -> str:
     """
 
     try:
-        import re
-
         # Resolve path relative to work_path
         if not os.path.isabs(path):
             path = os.path.join(_work_path, path)
@@ -135,30 +237,45 @@ def grep_files(pattern: str, path: str = ".", file_pattern: str = "*") -> str:
             return f"Error: Path '{path}' does not exist"
 
         results: List[str] = []
-        regex = re.compile(pattern, re.IGNORECASE)
-
-        # Find files matching the pattern
-        files = (
-            list(path_obj.rglob(file_pattern))
-            if any(c in file_pattern for c in "*?[]")
-            else path_obj.rglob("*")
-        )
-
-        for file_path in files:
-            if not file_path.is_file():
+        regex = _compile_regex(pattern)
+        prefix_len = _prefix_len(path_obj)
+
+        # Find files matching the pattern. Like pathlib, ignore "." and empty
+        # segments so "./*.py" means "*.py".
+        matcher = None
+        entries: Iterable[Union[os.DirEntry[str], Path]]
+        pattern_parts = PurePath(file_pattern).parts
+        if glob.has_magic(file_pattern) and len(pattern_parts) > 1:
+            # Multi-segment patterns keep rglob's semantics, which include
+            # following symlinked directories matched by a non-"**" segment
+            entries = _rglob_pruned(path_obj, file_pattern)
+        else:
+            if glob.has_magic(file_pattern):
+                matcher = _compile_glob(pattern_parts[0])
+            entries = _walk(os.fspath(path_obj))
+
+        for entry in entries:
+            file_path = os.fspath(entry)
+            rel = file_path[prefix_len:]
+            if matcher is not None and not matcher.match(rel):
+                continue
+            if os.path.splitext(entry.name)[1].lower() in _BINARY_EXTS:
                 continue
 
             try:
-                content = file_path.read_text(encoding="utf-8")
-                lines = content.splitlines()
+                if not entry.is_file():
+                    continue
+                if entry.stat().st_size > _MAX_GREP_BYTES:
+                    continue
+
+                with open(file_path, encoding="utf-8") as f:
+                    lines = f.read().splitlines()
 
                 for line_num, line in enumerate(lines, 1):
                     if regex.search(line):
-                        results.append(
-                            f"{file_path.relative_to(path_obj)}:{line_num}: {line}"
-                        )
+                        results.append(f"{rel}:{line_num}: {line}")
 
-            except (UnicodeDecodeError, PermissionError):
+            except (UnicodeDecodeError, OSError):
                 continue
 
         if not results:
@@ -196,12 +313,15 @@ def glob_files(pattern: str, path: str = ".") -> str:
             return f"No files found matching pattern '{pattern}' in '{path}'"
 
         # Sort results and format output
+        prefix_len = _prefix_len(path_obj)
         results: List[str] = []
         for match in sorted(matches):
+            # "**" also matches the root itself, which relative_to renders as "."
+            rel = os.fspath(match)[prefix_len:] or "."
             if match.is_file():
-                results.append(f"  {match.relative_to(path_obj)}")
+                results.append(f"  {rel}")
             else:
-                results.append(f"📁 {match.relative_to(path_obj)}/")
+                results.append(f"📁 {rel}/")
 
         return f"Files matching '{pattern}' in '{path}':\n" + "\n".join(results)
     except Exception as e:
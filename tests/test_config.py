@@ -1,6 +1,5 @@
-import tempfile
-from pathlib import Path
-from unittest.mock import patch
+import json
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -13,18 +12,65 @@ from grape_coder.config import (
     ProviderType,
 )
 
+# Shared by tests that only read it; save_config never mutates its argument.
+# Known to be valid (see test_valid_config), so skip validation when building it.
+_SAMPLE_CONFIG = GrapeCoderConfig.model_construct(
+    providers={
+        "openai": ProviderConfig.model_construct(
+            provider=ProviderType.OPENAI, api_key="test-key", api_base_url=None
+        )
+    },
+    agents={
+        AgentIdentifier.CODE: AgentConfig.model_construct(
+            provider_ref="openai", model_name="gpt-4o"
+        )
+    },
+)
+
+_EMPTY_DROPPED = {
+    "malformed_providers": [],
+    "malformed_agents": [],
+    "unrecognized_agents": [],
+    "orphaned_agents": [],
+}
+
+
+@pytest.fixture
+def config_manager(tmp_path, monkeypatch):
+    """ConfigManager whose config directory lives in the test's tmp_path."""
+    config_dir = tmp_path / "grape-coder"
+    monkeypatch.setattr(
+        "platformdirs.user_config_dir", lambda *args, **kwargs: str(config_dir)
+    )
+    return ConfigManager()
+
+
+@pytest.fixture
+def mock_create_litellm_model(monkeypatch):
+    """Replace model creation in the config manager with a mock."""
+    mock = MagicMock(return_value="mock_model")
+    monkeypatch.setattr("grape_coder.config.manager.create_litellm_model", mock)
+    return mock
+
 
 class TestProviderConfig:
     """Test ProviderConfig validation."""
 
-    def test_valid_provider_config(self):
-        """Test creating a valid provider configuration."""
+    @pytest.mark.parametrize(
+        "provider,api_base_url",
+        [
+            (ProviderType.OPENAI, None),
+            (ProviderType.CUSTOM, "https://api.example.com"),
+        ],
+    )
+    def test_valid_provider_config(self, provider, api_base_url):
+        """Test creating valid provider configurations."""
         config = ProviderConfig(
-            provider=ProviderType.OPENAI, api_key="test-key", api_base_url=None
+            provider=provider, api_key="test-key", api_base_url=api_base_url
         )
-        assert config.provider == ProviderType.OPENAI
+        assert config.provider == provider
         assert config.api_key == "test-key"
-        assert config.api_base_url is None
+        assert config.api_base_url == api_base_url
 
     def test_custom_provider_requires_base_url(self):
         """Test that custom providers require base URL."""
@@ -35,16 +81,6 @@ class TestProviderConfig:
                 provider=ProviderType.CUSTOM, api_key="test-key", api_base_url=None
             )
 
-    def test_custom_provider_with_base_url(self):
-        """Test custom provider with base URL."""
-        config = ProviderConfig(
-            provider=ProviderType.CUSTOM,
-            api_key="test-key",
-            api_base_url="https://api.example.com",
-        )
-        assert config.provider == ProviderType.CUSTOM
-        assert config.api_base_url == "https://api.example.com"
-
 
 class TestAgentConfig:
     """Test AgentConfig validation."""
@@ -100,328 +136,193 @@ class TestGrapeCoderConfig:
 class TestConfigManager:
     """Test ConfigManager functionality."""
 
-    def test_init_creates_config_directory(self):
+    def test_init_creates_config_directory(self, config_manager):
         """Test that initialization creates config directory."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            with patch("platformdirs.user_config_dir", return_value=temp_dir):
-                _ = ConfigManager()
-                config_dir = Path(temp_dir)
-                assert config_dir.exists()
-                assert config_dir.is_dir()
-
-    def test_load_empty_config(self):
+        config_dir = config_manager._config_dir
+        assert config_dir.exists()
+        assert config_dir.is_dir()
+
+    def test_load_empty_config(self, config_manager):
         """Test loading configuration when no file exists."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            with patch("platformdirs.user_config_dir", return_value=temp_dir):
-                manager = ConfigManager()
-                config_result = manager._load_config_from_file()
-                config, dropped_items = config_result
-                assert isinstance(config, GrapeCoderConfig)
-                assert config.providers == {}
-                assert config.agents == {}
-                assert dropped_items == {
-                    "malformed_providers": [],
-                    "malformed_agents": [],
-                    "unrecognized_agents": [],
-                    "orphaned_agents": [],
-                }
-
-    def test_save_and_load_config(self):
-        """Test saving and loading configuration."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            with patch("platformdirs.user_config_dir", return_value=temp_dir):
-                manager = ConfigManager()
-
-                # Create test configuration
-                config = GrapeCoderConfig(
-                    providers={
-                        "openai": ProviderConfig(
-                            provider=ProviderType.OPENAI,
-                            api_key="test-key",
-                            api_base_url=None,
-                        )
-                    },
-                    agents={
-                        AgentIdentifier.CODE: AgentConfig(
-                            provider_ref="openai", model_name="gpt-4o"
-                        )
-                    },
-                )
+        config_result = config_manager._load_config_from_file()
+        config, dropped_items = config_result
+        assert isinstance(config, GrapeCoderConfig)
+        assert config.providers == {}
+        assert config.agents == {}
+        assert dropped_items == _EMPTY_DROPPED
 
-                # Save configuration
-                manager.save_config(config)
+    def test_save_and_load_config(self, config_manager):
+        """Test saving and loading configuration."""
+        # Save configuration
+        config_manager.save_config(_SAMPLE_CONFIG)
 
-                # Load configuration
-                config_result = manager._load_config_from_file()
-                loaded_config, dropped_items = config_result
+        # Load configuration
+        config_result = config_manager._load_config_from_file()
+        loaded_config, dropped_items = config_result
 
-                assert loaded_config.providers == config.providers
-                assert loaded_config.agents == config.agents
-                assert dropped_items == {
-                    "malformed_providers": [],
-                    "malformed_agents": [],
-                    "unrecognized_agents": [],
-                    "orphaned_agents": [],
-                }
+        assert loaded_config.model_dump_json() == _SAMPLE_CONFIG.model_dump_json()
+        assert dropped_items == _EMPTY_DROPPED
 
-    def test_config_exists(self):
+    def test_config_exists(self, config_manager):
         """Test checking if configuration file exists."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            with patch("platformdirs.user_config_dir", return_value=temp_dir):
-                manager = ConfigManager()
-
-                # Should not exist initially
-                assert not manager.config_exists()
+        # Should not exist initially
+        assert not config_manager.config_exists()
 
-                # Save configuration
-                config = GrapeCoderConfig()
-                manager.save_config(config)
+        # Save configuration
+        config = GrapeCoderConfig()
+        config_manager.save_config(config)
 
-                # Should exist now
-                assert manager.config_exists()
+        # Should exist now
+        assert config_manager.config_exists()
 
-    def test_invalid_json_handling(self):
+    def test_invalid_json_handling(self, config_manager):
         """Test handling of invalid JSON in configuration file."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            with patch("platformdirs.user_config_dir", return_value=temp_dir):
-                manager = ConfigManager()
-
-                # Write invalid JSON
-                config_file = manager._config_file
-                config_file.write_text("{ invalid json }")
-
-                # Should return empty config and dropped items (graceful handling)
-                config_result = manager._load_config_from_file()
-                config, dropped_items = config_result
-
-                assert isinstance(config, GrapeCoderConfig)
-                assert config.providers == {}
-                assert config.agents == {}
-                assert dropped_items == {
-                    "malformed_providers": [],
-                    "malformed_agents": [],
-                    "unrecognized_agents": [],
-                    "orphaned_agents": [],
-                }
-
-    def test_cache_invalidation(self):
+        # Write invalid JSON
+        config_file = config_manager._config_file
+        config_file.write_bytes(b"{ invalid json }")
+
+        # Should return empty config and dropped items (graceful handling)
+        config_result = config_manager._load_config_from_file()
+        config, dropped_items = config_result
+
+        assert isinstance(config, GrapeCoderConfig)
+        assert config.providers == {}
+        assert config.agents == {}
+        assert dropped_items == _EMPTY_DROPPED
+
+    def test_partial_load_matches_full_load(self, config_manager):
+        """Test that salvaging entries yields the same config as a valid file."""
+        config_manager.save_config(_SAMPLE_CONFIG)
+        full_config, _ = config_manager._load_config_from_file()
+
+        # An unrecognized agent forces the per-entry fallback
+        config_data = json.loads(config_manager._config_file.read_bytes())
+        config_data["agents"]["unknown_agent"] = {
+            "provider_ref": "openai",
+            "model_name": "gpt-4o",
+        }
+        config_manager._config_file.write_bytes(json.dumps(config_data).encode())
+
+        partial_config, dropped_items = config_manager._load_config_from_file()
+
+        assert partial_config == full_config
+        assert partial_config == _SAMPLE_CONFIG
+        assert dropped_items["unrecognized_agents"] == ["unknown_agent"]
+
+    def test_cache_invalidation(self, config_manager):
         """Test that cache is invalidated when file changes."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            with patch("platformdirs.user_config_dir", return_value=temp_dir):
-                manager = ConfigManager()
-
-                # Load initial config
-                config_result1 = manager._load_config_from_file()
-                config1, _ = config_result1
-
-                # Save new config
-                config2 = GrapeCoderConfig(
-                    providers={
-                        "openai": ProviderConfig(
-                            provider=ProviderType.OPENAI,
-                            api_key="test-key",
-                            api_base_url=None,
-                        )
-                    }
+        # Load initial config
+        config_result1 = config_manager._load_config_from_file()
+        config1, _ = config_result1
+
+        # Save new config
+        config2 = GrapeCoderConfig(
+            providers={
+                "openai": ProviderConfig(
+                    provider=ProviderType.OPENAI,
+                    api_key="test-key",
+                    api_base_url=None,
                 )
-                manager.save_config(config2)
+            }
+        )
+        config_manager.save_config(config2)
 
-                # Load again - should get updated config
-                config_result3 = manager._load_config_from_file()
-                config3, _ = config_result3
-                assert config3.providers == config2.providers
-                assert config3.providers != config1.providers
+        # Load again - should get updated config
+        config_result3 = config_manager._load_config_from_file()
+        config3, _ = config_result3
+        assert config3.providers == config2.providers
+        assert config3.providers != config1.providers
 
-    def test_get_model_success(self):
+    def test_get_model_success(self, config_manager, mock_create_litellm_model):
         """Test successful model retrieval."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            with patch("platformdirs.user_config_dir", return_value=temp_dir):
-                manager = ConfigManager()
-
-                # Create test configuration
-                config = GrapeCoderConfig(
-                    providers={
-                        "openai": ProviderConfig(
-                            provider=ProviderType.OPENAI,
-                            api_key="test-key",
-                            api_base_url=None,
-                        )
-                    },
-                    agents={
-                        AgentIdentifier.CODE: AgentConfig(
-                            provider_ref="openai", model_name="gpt-4o"
-                        )
-                    },
-                )
-                manager.save_config(config)
-
-                # Mock the create_litellm_model function
-                with patch(
-                    "grape_coder.config.manager.create_litellm_model"
-                ) as mock_create:
-                    mock_model = "mock_model"
-                    mock_create.return_value = mock_model
-
-                    # Get model
-                    model = manager.get_model(AgentIdentifier.CODE)
-
-                    # Verify model creation was called correctly
-                    mock_create.assert_called_once_with(
-                        config.providers["openai"],
-                        config.agents[AgentIdentifier.CODE].model_name,
-                    )
-                    assert model == mock_model
+        # Save test configuration
+        config_manager.save_config(_SAMPLE_CONFIG)
 
-    def test_get_model_caching(self):
-        """Test that models are cached."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            with patch("platformdirs.user_config_dir", return_value=temp_dir):
-                manager = ConfigManager()
-
-                # Create test configuration
-                config = GrapeCoderConfig(
-                    providers={
-                        "openai": ProviderConfig(
-                            provider=ProviderType.OPENAI,
-                            api_key="test-key",
-                            api_base_url=None,
-                        )
-                    },
-                    agents={
-                        AgentIdentifier.CODE: AgentConfig(
-                            provider_ref="openai", model_name="gpt-4o"
-                        )
-                    },
-                )
-                manager.save_config(config)
+        # Get model
+        model = config_manager.get_model(AgentIdentifier.CODE)
 
-                # Mock the create_litellm_model function
-                with patch(
-                    "grape_coder.config.manager.create_litellm_model"
-                ) as mock_create:
-                    mock_model = "mock_model"
-                    mock_create.return_value = mock_model
+        # Verify model creation was called correctly
+        mock_create_litellm_model.assert_called_once_with(
+            _SAMPLE_CONFIG.providers["openai"],
+            _SAMPLE_CONFIG.agents[AgentIdentifier.CODE].model_name,
+        )
+        assert model == "mock_model"
 
-                    # Get model twice
-                    model1 = manager.get_model(AgentIdentifier.CODE)
-                    model2 = manager.get_model(AgentIdentifier.CODE)
+    def test_get_model_caching(self, config_manager, mock_create_litellm_model):
+        """Test that models are cached."""
+        # Save test configuration
+        config_manager.save_config(_SAMPLE_CONFIG)
 
-                    # Should only create model once (cached)
-                    mock_create.assert_called_once()
-                    assert model1 == mock_model
-                    assert model2 == mock_model
+        # Get model twice
+        model1 = config_manager.get_model(AgentIdentifier.CODE)
+        model2 = config_manager.get_model(AgentIdentifier.CODE)
 
-    def test_get_model_no_agents_configured(self):
-        """Test get_model when no agents are configured."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            with patch("platformdirs.user_config_dir", return_value=temp_dir):
-                manager = ConfigManager()
+        # Should only create model once (cached)
+        mock_create_litellm_model.assert_called_once()
+        assert model1 == "mock_model"
+        assert model2 == "mock_model"
 
-                # Save empty config
-                manager.save_config(GrapeCoderConfig())
+    def test_get_model_no_agents_configured(self, config_manager):
+        """Test get_model when no agents are configured."""
+        # Save empty config
+        config_manager.save_config(GrapeCoderConfig())
 
-                # Should raise ValueError
-                with pytest.raises(ValueError, match="No agents configured"):
-                    manager.get_model(AgentIdentifier.CODE)
+        # Should raise ValueError
+        with pytest.raises(ValueError, match="No agents configured"):
+            config_manager.get_model(AgentIdentifier.CODE)
 
-    def test_get_model_agent_not_found(self):
+    def test_get_model_agent_not_found(self, config_manager):
         """Test get_model when agent is not found."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            with patch("platformdirs.user_config_dir", return_value=temp_dir):
-                manager = ConfigManager()
-
-                # Create test configuration with different agent
-                config = GrapeCoderConfig(
-                    providers={
-                        "openai": ProviderConfig(
-                            provider=ProviderType.OPENAI,
-                            api_key="test-key",
-                            api_base_url=None,
-                        )
-                    },
-                    agents={
-                        "other_agent": AgentConfig(
-                            provider_ref="openai", model_name="gpt-4o"
-                        )
-                    },
+        # Create test configuration with different agent
+        config = GrapeCoderConfig(
+            providers={
+                "openai": ProviderConfig(
+                    provider=ProviderType.OPENAI,
+                    api_key="test-key",
+                    api_base_url=None,
+                )
+            },
+            agents={
+                "other_agent": AgentConfig(
+                    provider_ref="openai", model_name="gpt-4o"
                 )
-                manager.save_config(config)
+            },
+        )
+        config_manager.save_config(config)
 
-                # Should raise ValueError
-                with pytest.raises(
-                    ValueError, match=f"Agent '{AgentIdentifier.CODE}' not found"
-                ):
-                    manager.get_model(AgentIdentifier.CODE)
+        # Should raise ValueError
+        with pytest.raises(
+            ValueError, match=f"Agent '{AgentIdentifier.CODE}' not found"
+        ):
+            config_manager.get_model(AgentIdentifier.CODE)
 
-    def test_get_model_creation_failure(self):
+    def test_get_model_creation_failure(
+        self, config_manager, mock_create_litellm_model
+    ):
         """Test get_model when model creation fails."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            with patch("platformdirs.user_config_dir", return_value=temp_dir):
-                manager = ConfigManager()
-
-                # Create test configuration
-                config = GrapeCoderConfig(
-                    providers={
-                        "openai": ProviderConfig(
-                            provider=ProviderType.OPENAI,
-                            api_key="test-key",
-                            api_base_url=None,
-                        )
-                    },
-                    agents={
-                        AgentIdentifier.CODE: AgentConfig(
-                            provider_ref="openai", model_name="gpt-4o"
-                        )
-                    },
-                )
-                manager.save_config(config)
+        # Save test configuration
+        config_manager.save_config(_SAMPLE_CONFIG)
 
-                # Mock the create_litellm_model function to raise exception
-                with patch(
-                    "grape_coder.config.manager.create_litellm_model"
-                ) as mock_create:
-                    mock_create.side_effect = Exception("Model creation failed")
+        # Make model creation raise
+        mock_create_litellm_model.side_effect = Exception("Model creation failed")
 
-                    # Should raise RuntimeError
-                    with pytest.raises(RuntimeError, match="Failed to create model"):
-                        manager.get_model(AgentIdentifier.CODE)
+        # Should raise RuntimeError
+        with pytest.raises(RuntimeError, match="Failed to create model"):
+            config_manager.get_model(AgentIdentifier.CODE)
 
-    def test_clear_cache_clears_model_cache(self):
+    def test_clear_cache_clears_model_cache(
+        self, config_manager, mock_create_litellm_model
+    ):
         """Test that clear_cache also clears the model cache."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            with patch("platformdirs.user_config_dir", return_value=temp_dir):
-                manager = ConfigManager()
-
-                # Create test configuration
-                config = GrapeCoderConfig(
-                    providers={
-                        "openai": ProviderConfig(
-                            provider=ProviderType.OPENAI,
-                            api_key="test-key",
-                            api_base_url=None,
-                        )
-                    },
-                    agents={
-                        AgentIdentifier.CODE: AgentConfig(
-                            provider_ref="openai", model_name="gpt-4o"
-                        )
-                    },
-                )
-                manager.save_config(config)
-
-                # Mock the create_litellm_model function
-                with patch(
-                    "grape_coder.config.manager.create_litellm_model"
-                ) as mock_create:
-                    mock_model = "mock_model"
-                    mock_create.return_value = mock_model
+        # Save test configuration
+        config_manager.save_config(_SAMPLE_CONFIG)
 
-                    # Get model to populate cache
-                    manager.get_model(AgentIdentifier.CODE)
-                    assert len(manager._model_cache) == 1
+        # Get model to populate cache
+        config_manager.get_model(AgentIdentifier.CODE)
+        assert len(config_manager._model_cache) == 1
 
-                    # Clear cache
-                    manager.clear_cache()
+        # Clear cache
+        config_manager.clear_cache()
 
-                    # Model cache should be empty
-                    assert len(manager._model_cache) == 0
+        # Model cache should be empty
+        assert len(config_manager._model_cache) == 0
@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock, patch
+import pytest
 
 from grape_coder.config import (
     LiteLLMModel,
@@ -8,6 +8,47 @@ from grape_coder.config import (
 )
 
 
+class _FakeStrandsModel:
+    """Stand-in for the Strands LiteLLM model that records its arguments."""
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+    def get_config(self):
+        return {"model_id": self.kwargs["model_id"]}
+
+
+@pytest.fixture
+def fake_strands_model(monkeypatch):
+    """Make model creation build a _FakeStrandsModel instead of a real one."""
+    monkeypatch.setattr(
+        "grape_coder.config.litellm_integration.StrandsLiteLLMModel",
+        _FakeStrandsModel,
+    )
+    return _FakeStrandsModel
+
+
+@pytest.fixture(scope="module")
+def openai_provider():
+    return ProviderConfig(
+        provider=ProviderType.OPENAI, api_key="test-key", api_base_url=None
+    )
+
+
+@pytest.fixture
+def openai_model(fake_strands_model, openai_provider):
+    return LiteLLMModel(openai_provider, "gpt-4o")
+
+
+@pytest.fixture(scope="module")
+def custom_provider():
+    return ProviderConfig(
+        provider=ProviderType.CUSTOM,
+        api_key="test-key",
+        api_base_url="https://api.example.com",
+    )
+
+
 class TestProviderFactory:
     """Test ProviderFactory functionality."""
 
@@ -25,117 +66,84 @@ class TestProviderFactory:
         mistral_models = ProviderFactory.get_suggested_models(ProviderType.MISTRAL)
         assert "mistral-large-latest" in mistral_models
 
-    def test_validate_model_format(self):
+    @pytest.mark.parametrize(
+        "provider_type,model_name,expected",
+        [
+            (ProviderType.OPENAI, "gpt-4o", True),
+            (ProviderType.CUSTOM, "any-model", True),
+            (ProviderType.OPENAI, "", False),
+            (ProviderType.OPENAI, "model with spaces", False),
+            (ProviderType.OPENAI, "a" * 101, False),  # Too long
+        ],
+    )
+    def test_validate_model_format(self, provider_type, model_name, expected):
         """Test model name format validation."""
-        # Valid formats
-        assert ProviderFactory.validate_model_format(ProviderType.OPENAI, "gpt-4o")
-        assert ProviderFactory.validate_model_format(ProviderType.CUSTOM, "any-model")
-
-        # Invalid formats
-        assert not ProviderFactory.validate_model_format(ProviderType.OPENAI, "")
-        assert not ProviderFactory.validate_model_format(
-            ProviderType.OPENAI, "model with spaces"
+        assert (
+            ProviderFactory.validate_model_format(provider_type, model_name)
+            is expected
         )
-        assert not ProviderFactory.validate_model_format(
-            ProviderType.OPENAI, "a" * 101
-        )  # Too long
 
-    @patch("grape_coder.config.litellm_integration.StrandsLiteLLMModel")
-    def test_create_model(self, mock_strands_model):
+    def test_create_model(self, fake_strands_model, openai_provider):
         """Test creating a model instance."""
-        mock_model_instance = MagicMock()
-        mock_strands_model.return_value = mock_model_instance
-
-        provider_config = ProviderConfig(
-            provider=ProviderType.OPENAI, api_key="test-key", api_base_url=None
-        )
-
-        model = ProviderFactory.create_model(provider_config, "gpt-4o")
+        model = ProviderFactory.create_model(openai_provider, "gpt-4o")
 
         assert isinstance(model, LiteLLMModel)
-        assert model.provider_config == provider_config
+        assert isinstance(model.model, fake_strands_model)
+        assert model.provider_config == openai_provider
         assert model.model_name == "gpt-4o"
 
 
 class TestLiteLLMModel:
     """Test LiteLLMModel functionality."""
 
-    @patch("grape_coder.config.litellm_integration.StrandsLiteLLMModel")
-    def test_model_creation(self, mock_strands_model):
-        """Test model creation with provider config."""
-        mock_model_instance = MagicMock()
-        mock_strands_model.return_value = mock_model_instance
-
-        provider_config = ProviderConfig(
-            provider=ProviderType.OPENAI, api_key="test-key", api_base_url=None
-        )
-
-        _ = LiteLLMModel(provider_config, "gpt-4o")
-
+    @pytest.mark.parametrize(
+        "provider_fixture,model_name,expected_id,expected_client_args",
+        [
+            (
+                "openai_provider",
+                "gpt-4o",
+                "openai/gpt-4o",
+                {"api_key": "test-key"},
+            ),
+            # Custom providers are prefixed with openai/
+            (
+                "custom_provider",
+                "custom-model",
+                "openai/custom-model",
+                {"api_key": "test-key", "api_base": "https://api.example.com"},
+            ),
+            # Names already prefixed with openai/ are double-prefixed (litellm wants it that way)
+            (
+                "custom_provider",
+                "openai/gpt-4o",
+                "openai/openai/gpt-4o",
+                {"api_key": "test-key", "api_base": "https://api.example.com"},
+            ),
+        ],
+    )
+    def test_model_id(
+        self,
+        request,
+        fake_strands_model,
+        provider_fixture,
+        model_name,
+        expected_id,
+        expected_client_args,
+    ):
+        """Test model ID generation and underlying model creation."""
+        provider_config = request.getfixturevalue(provider_fixture)
+
+        model = LiteLLMModel(provider_config, model_name)
+
+        assert model.model_id == expected_id
         # Verify the underlying model was created correctly
-        mock_strands_model.assert_called_once_with(
-            model_id="openai/gpt-4o", client_args={"api_key": "test-key"}
-        )
-
-    @patch("grape_coder.config.litellm_integration.StrandsLiteLLMModel")
-    def test_custom_provider_model_id(self, mock_strands_model):
-        """Test LiteLLM model ID generation for custom providers."""
-        mock_model_instance = MagicMock()
-        mock_strands_model.return_value = mock_model_instance
-
-        provider_config = ProviderConfig(
-            provider=ProviderType.CUSTOM,
-            api_key="test-key",
-            api_base_url="https://api.example.com",
-        )
+        assert model.model.kwargs == {
+            "model_id": expected_id,
+            "client_args": expected_client_args,
+        }
 
-        _ = LiteLLMModel(provider_config, "custom-model")
-
-        # Verify the model ID is prefixed with openai/ for custom providers
-        mock_strands_model.assert_called_once_with(
-            model_id="openai/custom-model",
-            client_args={"api_key": "test-key", "api_base": "https://api.example.com"},
-        )
-
-    @patch("grape_coder.config.litellm_integration.StrandsLiteLLMModel")
-    def test_model_delegation(self, mock_strands_model):
+    def test_model_delegation(self, openai_model):
         """Test that model calls are delegated to underlying strands model."""
-        mock_model_instance = MagicMock()
-        mock_strands_model.return_value = mock_model_instance
-
-        provider_config = ProviderConfig(
-            provider=ProviderType.OPENAI, api_key="test-key", api_base_url=None
-        )
-
-        model = LiteLLMModel(provider_config, "gpt-4o")
-
         # Test attribute delegation
-        mock_model_instance.some_method.return_value = "test result"
-        assert model.some_method() == "test result"
-        mock_model_instance.some_method.assert_called_once()
-
-    @patch("grape_coder.config.litellm_integration.StrandsLiteLLMModel")
-    def test_model_id_property(self, mock_strands_model):
-        """Test model_id property."""
-        mock_model_instance = MagicMock()
-        mock_strands_model.return_value = mock_model_instance
-
-        provider_config = ProviderConfig(
-            provider=ProviderType.OPENAI, api_key="test-key", api_base_url=None
-        )
-
-        model = LiteLLMModel(provider_config, "gpt-4o")
-        assert model.model_id == "openai/gpt-4o"
-
-        # Test custom provider
-        custom_config = ProviderConfig(
-            provider=ProviderType.CUSTOM,
-            api_key="test-key",
-            api_base_url="https://api.example.com",
-        )
-        custom_model = LiteLLMModel(custom_config, "custom-model")
-        assert custom_model.model_id == "openai/custom-model"
-
-        # Test that model names already prefixed with openai/ are double-prefixed (litellm wants it that way)
-        already_prefixed_model = LiteLLMModel(custom_config, "openai/gpt-4o")
-        assert already_prefixed_model.model_id == "openai/openai/gpt-4o"
+        assert openai_model.get_config() == {"model_id": "openai/gpt-4o"}
+        assert openai_model.kwargs is openai_model.model.kwargs
@@ -0,0 +1,128 @@
+import os
+
+import pytest
+
+# grape_coder.tools and grape_coder.agents import each other; loading the
+# agents package first lets the tools modules import cleanly on their own.
+import grape_coder.agents  # noqa: F401
+from grape_coder.tools.work_path import edit_file, grep_files, list_files
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Small project tree with hidden files and directories that get pruned."""
+    files = {
+        "a.py": "hello from a",
+        "sub/b.py": "hello from b",
+        "sub/deep/c.py": "hello from c",
+        ".hidden.py": "hello from hidden",
+        "page.html": "hello from html",
+        ".git/config.py": "hello from git",
+        "node_modules/pkg/index.py": "hello from node_modules",
+        "sub/node_modules/pkg/index.py": "hello from nested node_modules",
+    }
+    for rel, content in files.items():
+        file_path = tmp_path / rel
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(content + "\n")
+    return tmp_path
+
+
+def _matched_files(result: str) -> set[str]:
+    """Relative paths of the files listed in a grep_files result."""
+    if not result.startswith("Matches"):
+        return set()
+    return {line.split(":", 1)[0] for line in result.splitlines()[1:]}
+
+
+class TestGrepFiles:
+    """Test grep_files file selection."""
+
+    @pytest.mark.parametrize(
+        "file_pattern,expected",
+        [
+            ("*.py", {"a.py", "sub/b.py", "sub/deep/c.py", ".hidden.py"}),
+            ("./*.py", {"a.py", "sub/b.py", "sub/deep/c.py", ".hidden.py"}),
+            ("sub/*.py", {"sub/b.py"}),
+            ("./sub/*.py", {"sub/b.py"}),
+            ("sub/**/*.py", {"sub/b.py", "sub/deep/c.py"}),
+            (".*.py", {".hidden.py"}),
+            ("*.html", {"page.html"}),
+        ],
+    )
+    def test_file_pattern(self, project, file_pattern, expected):
+        """Test that file patterns select the same files as Path.rglob."""
+        result = grep_files("hello", str(project), file_pattern)
+        assert _matched_files(result) == expected
+
+    def test_skips_ignored_directories(self, project):
+        """Test that .git and node_modules are never searched."""
+        result = grep_files("hello", str(project))
+        assert _matched_files(result) == {
+            "a.py",
+            "sub/b.py",
+            "sub/deep/c.py",
+            ".hidden.py",
+            "page.html",
+        }
+
+    def test_skips_ignored_directories_with_nested_pattern(self, project):
+        """Test pruning for patterns with more than one path segment."""
+        result = grep_files("hello", str(project), "*/*/*.py")
+        assert _matched_files(result) == {"sub/deep/c.py"}
+
+    @pytest.mark.skipif(not hasattr(os, "symlink"), reason="needs symlinks")
+    def test_follows_symlinked_directory_named_by_pattern(self, project):
+        """Test that "*/*.py" reaches files under a symlinked directory."""
+        (project / "link").symlink_to(project / "sub", target_is_directory=True)
+        result = grep_files("hello", str(project), "*/*.py")
+        assert _matched_files(result) == {"sub/b.py", "sub/deep/c.py", "link/b.py"}
+
+    def test_line_numbers(self, project):
+        """Test that matches are reported with their line numbers."""
+        (project / "a.py").write_text("first\nhello again\n")
+        result = grep_files("again", str(project), "*.py")
+        assert result.splitlines()[1:] == ["a.py:2: hello again"]
+
+
+class TestListFiles:
+    """Test recursive list_files."""
+
+    def test_recursive_skips_ignored_directories(self, project):
+        """Test that .git and node_modules are left out of the listing."""
+        result = list_files(str(project), recursive=True)
+        entries = {line.strip() for line in result.splitlines()[1:]}
+        assert entries == {
+            "a.py",
+            "page.html",
+            ".hidden.py",
+            "📁 sub/",
+            "sub/b.py",
+            "📁 sub/deep/",
+            "sub/deep/c.py",
+        }
+
+
+class TestEditFile:
+    """Test edit_file."""
+
+    def test_reports_created_then_updated(self, tmp_path):
+        """Test the created/updated message and that the content is written."""
+        file_path = tmp_path / "index.html"
+
+        result = edit_file(str(file_path), "<p>first</p>")
+        assert result == f"File '{file_path}' created successfully"
+        assert file_path.read_text() == "<p>first</p>"
+
+        result = edit_file(str(file_path), "<p>second</p>")
+        assert result == f"File '{file_path}' updated successfully"
+        assert file_path.read_text() == "<p>second</p>"
+
+    def test_creates_missing_parent_directories(self, tmp_path):
+        """Test that missing parent directories are created."""
+        file_path = tmp_path / "style" / "themes" / "dark.css"
+
+        result = edit_file(str(file_path), "body { color: white; }")
+
+        assert result == f"File '{file_path}' created successfully"
+        assert file_path.read_text() == "body { color: white; }"